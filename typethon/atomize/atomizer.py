@@ -36,6 +36,28 @@ UNARY_OPERATORS = {
 }
 
 
+LITERAL_CONSTANTS: typing.Dict[type, typing.Callable[..., atoms.Atom]] = {
+    ast.StringNode: atoms.StringAtom,
+    ast.IntegerNode: atoms.IntegerAtom,
+    ast.FloatNode: atoms.FloatAtom,
+    ast.ComplexNode: atoms.ComplexAtom,
+}
+
+# Atoms for keyword constants, as (type context, code context)
+KEYWORD_CONSTANTS: typing.Dict[ast.ConstantType, typing.Tuple[atoms.Atom, atoms.Atom]] = {
+    ast.ConstantType.TRUE: (atoms.TRUE, atoms.BoolAtom(True, flags=atoms.AtomFlags.IMPLICIT)),
+    ast.ConstantType.FALSE: (atoms.FALSE, atoms.BoolAtom(False, flags=atoms.AtomFlags.IMPLICIT)),
+    ast.ConstantType.NONE: (atoms.NONE, atoms.NONE),
+    ast.ConstantType.ELLIPSIS: (atoms.ELLIPSIS, atoms.ELLIPSIS),
+}
+
+# Shared atoms for small integer literals, as (type context, code context)
+INTEGER_CONSTANTS: typing.Dict[int, typing.Tuple[atoms.Atom, atoms.Atom]] = {
+    value: (atom, atoms.IntegerAtom(value, flags=atoms.AtomFlags.IMPLICIT))
+    for value, atom in atoms.SMALL_INTEGERS.items() if value >= 0
+}
+
+
 class AtomizerContext(enum.Enum):
     CODE = enum.auto()
     TYPE = enum.auto()
@@ -52,6 +74,13 @@ class Atomizer(NodeVisitor[atoms.Atom]):
 
         self.scope = Scope.create_global_scope()
 
+        # The node is kept alongside its atom so that its id cannot be reused.
+        # Results are keyed by node alone, which relies on every node being evaluated in
+        # one context and scope: annotations only as types, everything else only as code.
+        # FlowCore revisits nodes under the same scope to read back these results.
+        self.expression_atoms: typing.Dict[int, typing.Tuple[ast.ExpressionNode, atoms.Atom]] = {}
+        self.operator_functions: typing.Dict[typing.Tuple[atoms.AtomKind, str], atoms.Atom] = {}
+
     def is_evaluating_code(self) -> bool:
         return self.ctx is AtomizerContext.CODE
 
@@ -73,43 +102,45 @@ class Atomizer(NodeVisitor[atoms.Atom]):
 
     @contextlib.contextmanager
     def enter_scope(self, scope: Scope) -> typing.Generator[None, None, None]:
+        previous = self.scope
         self.scope = scope
-        yield
-        self.scope = self.scope.get_parent()
 
-    def visit_functiondef_node(self, statement: ast.FunctionDefNode) -> atoms.Atom:
-        self.scope = self.scope.create_function_scope()
+        try:
+            yield
+        finally:
+            self.scope = previous
 
+    def visit_functiondef_node(self, statement: ast.FunctionDefNode) -> atoms.Atom:
+        scope = self.scope.create_function_scope()
         parameters: typing.List[atoms.FunctionParameter] = []
 
-        for parameter in statement.parameters:
-            if parameter.annotation is None:
-                msg = 'parameter must be annotated'
-                return atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, message=msg)
+        with self.enter_scope(scope):
+            for parameter in statement.parameters:
+                if parameter.annotation is None:
+                    msg = 'parameter must be annotated'
+                    return atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, message=msg)
 
-            annotation = self.visit_type_expression(parameter.annotation)
-            self.scope.add_symbol(parameter.name, annotation.instantiate())
+                annotation = self.visit_type_expression(parameter.annotation)
+                scope.add_symbol(parameter.name, annotation.instantiate())
 
-            default = None
-            if parameter.default is not None:
-                default = self.visit_expression(parameter.default)
+                default = None
+                if parameter.default is not None:
+                    default = self.visit_expression(parameter.default)
 
-            parameter = atoms.FunctionParameter(
-                name=parameter.name, annotation=annotation, kind=parameter.kind, default=default
-            )
-            parameters.append(parameter)
+                parameter = atoms.FunctionParameter(
+                    name=parameter.name, annotation=annotation, kind=parameter.kind, default=default
+                )
+                parameters.append(parameter)
 
-        returns = None
-        if statement.returns is not None:
-            returns = self.visit_type_expression(statement.returns)
+            returns = None
+            if statement.returns is not None:
+                returns = self.visit_type_expression(statement.returns)
 
         fields = atoms.FunctionFields(
-            name=statement.name, parameters=parameters, returns=returns, scope=self.scope
+            name=statement.name, parameters=parameters, returns=returns, scope=scope
         )
         function = result = atoms.FunctionAtom(fields=fields)
 
-        self.scope = self.scope.get_parent()
-
         for decorator in reversed(statement.decorators):
             decorator = self.visit_expression(decorator)
             result = self.call(decorator, (result,))
@@ -130,16 +161,25 @@ class Atomizer(NodeVisitor[atoms.Atom]):
     def visit_assign_node(self, statement: ast.AssignNode) -> atoms.Atom:
         value = self.visit_expression(statement.value)
 
+        # Every name target is bound even if an earlier target is invalid
+        error: typing.Optional[atoms.ErrorAtom] = None
+
         for target in statement.targets:
-            self.visit_target(target, value)
+            target_error = self.visit_target(target, value)
+            if error is None:
+                error = target_error
 
-        return value
+        return error if error is not None else value
 
-    def visit_target(self, target: ast.ExpressionNode, value: atoms.Atom) -> None:
-        if isinstance(target, ast.NameNode):
+    def visit_target(
+        self, target: ast.ExpressionNode, value: atoms.Atom
+    ) -> typing.Optional[atoms.ErrorAtom]:
+        if type(target) is ast.NameNode:
             self.scope.add_symbol(target.value, value)
-        else:
-            assert False, f'invalid target {target}'
+            return None
+
+        msg = f'cannot assign to {type(target).__name__}'
+        return atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, msg)
 
     def get_type(self, atom: atoms.Atom) -> atoms.Atom:
         return atoms.get_type(atom)
@@ -173,6 +213,21 @@ class Atomizer(NodeVisitor[atoms.Atom]):
 
         return attribute
 
+    def get_operator(self, atom: atoms.Atom, name: str) -> atoms.Atom:
+        # Special methods are looked up on the implementation for the atom's kind,
+        # so a resolved function can be reused for every atom of that kind
+        key = (atom.kind, name)
+
+        function = self.operator_functions.get(key)
+        if function is not None:
+            return function
+
+        function = self.get_attribute(self.get_type(atom), name)
+        if function.kind is atoms.AtomKind.FUNCTION:
+            self.operator_functions[key] = function
+
+        return function
+
     def get_item(self, atom: atoms.Atom, slice: atoms.Atom) -> atoms.Atom:
         return atoms.UNKNOWN
 
@@ -189,8 +244,7 @@ class Atomizer(NodeVisitor[atoms.Atom]):
 
             return self.function_impl.call(atom, *arguments)
 
-        type = self.get_type(atom)
-        function = self.get_attribute(type, '__call__')
+        function = self.get_operator(atom, '__call__')
 
         if function.kind is atoms.AtomKind.UNKNOWN:
             return atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, f'{atom} is not callable')
@@ -202,14 +256,13 @@ class Atomizer(NodeVisitor[atoms.Atom]):
         if atom.kind is atoms.AtomKind.BOOL and not atom.is_type():
             return atom
 
-        type = self.get_type(atom)
-        function = self.get_attribute(type, '__bool__')
+        function = self.get_operator(atom, '__bool__')
 
         if function.kind is not atoms.AtomKind.UNKNOWN:
             result = self.call(function, (atom,))
             return result.unwrap_as(atoms.BoolAtom)
 
-        return atoms.BoolAtom(True)
+        return atoms.TRUE
 
     def visit_expr_node(self, statement: ast.ExprNode) -> atoms.Atom:
         return self.visit_expression(statement.expr)
@@ -221,14 +274,11 @@ class Atomizer(NodeVisitor[atoms.Atom]):
             msg = 'boolean operation is not valid in this context'
             return atoms.ErrorAtom(atoms.ErrorCategory.SYNTAX_ERROR, msg)
 
-        unknown = any(self.truthness(value).value is None for value in values)
-        if unknown:
+        truthnesses = [self.truthness(value).value for value in values]
+        if None in truthnesses:
             return atoms.union(values)
 
-        for value in values:
-            truthness = self.truthness(value).value
-            assert truthness is not None
-
+        for value, truthness in zip(values, truthnesses):
             if expression.op is ast.BoolOperator.AND and not truthness:
                 return value
             elif expression.op is ast.BoolOperator.OR and truthness:
@@ -237,23 +287,39 @@ class Atomizer(NodeVisitor[atoms.Atom]):
         return values[-1]
 
     def visit_binaryop_node(self, expression: ast.BinaryOpNode) -> atoms.Atom:
-        left = self.visit_expression(expression.left)
-        right = self.visit_expression(expression.right)
+        # Walk the left spine iteratively so that `a + b + c + ...` does not recurse
+        # once per operand; intermediate results are memoized like any other node.
+        chain = [expression]
 
+        operand = expression.left
+        while type(operand) is ast.BinaryOpNode and id(operand) not in self.expression_atoms:
+            chain.append(operand)
+            operand = operand.left
+
+        left = self.visit_expression(operand)
+
+        for node in reversed(chain):
+            right = self.visit_expression(node.right)
+            left = self.binary_operation(node.op, left, right)
+
+            if node is not expression:
+                self.expression_atoms[id(node)] = (node, left)
+
+        return left
+
+    def binary_operation(
+        self, operator: ast.Operator, left: atoms.Atom, right: atoms.Atom
+    ) -> atoms.Atom:
         if left.kind is atoms.AtomKind.UNKNOWN or right.kind is atoms.AtomKind.UNKNOWN:
             return atoms.union((left, right))
 
-        operators = OPERATORS[expression.op]
-
-        type = self.get_type(left)
-        function = self.get_attribute(type, operators[0])
+        operators = OPERATORS[operator]
 
+        function = self.get_operator(left, operators[0])
         result = self.call(function, (left, right))
 
         if result.kind is atoms.AtomKind.UNKNOWN:
-            type = self.get_type(right)
-            function = self.get_attribute(type, operators[1])
-
+            function = self.get_operator(right, operators[1])
             result = self.call(function, (right, left))
 
         return result
@@ -273,13 +339,11 @@ class Atomizer(NodeVisitor[atoms.Atom]):
             if truthness.value is None:
                 result = atoms.get_type(atoms.BOOL)
             else:
-                result = atoms.BoolAtom(not truthness.value)
+                result = atoms.FALSE if truthness.value else atoms.TRUE
         else:
             operator = UNARY_OPERATORS[expression.op]
 
-            type = self.get_type(operand)
-            function = self.get_attribute(type, operator[0])
-
+            function = self.get_operator(operand, operator[0])
             result = self.call(function, (operand,))
 
         return result
@@ -355,14 +419,16 @@ class Atomizer(NodeVisitor[atoms.Atom]):
         return atoms.SetAtom(atoms.union(elts))
 
     def visit_call_node(self, expression: ast.CallNode) -> atoms.Atom:
-        func = self.visit_expression(expression.func)
-        args = [self.visit_expression(arg) for arg in expression.args]
+        visit_expression = self.visit_expression
+
+        func = visit_expression(expression.func)
+        args = [visit_expression(arg) for arg in expression.args]
 
         kwargs: typing.Dict[str, atoms.Atom] = {}
         unpack: typing.List[atoms.Atom] = []
 
         for kwarg in expression.kwargs:
-            value = self.visit_expression(kwarg.value)
+            value = visit_expression(kwarg.value)
 
             if kwarg.name is not None:
                 kwargs[kwarg.name] = value
@@ -372,43 +438,28 @@ class Atomizer(NodeVisitor[atoms.Atom]):
         return self.call(func, args, kwargs, unpack)
 
     def visit_constant_node(self, expression: ast.ConstantNode) -> atoms.Atom:
-        if not self.is_evaluating_type() and not self.is_evaluating_code():
+        evaluating_type = self.is_evaluating_type()
+
+        if not evaluating_type and not self.is_evaluating_code():
             msg = 'constant is not valid in this context'
             return atoms.ErrorAtom(atoms.ErrorCategory.SYNTAX_ERROR, msg)
 
-        flags = atoms.AtomFlags.NONE
-
-        if not self.is_evaluating_type():
-            flags |= atoms.AtomFlags.IMPLICIT
-
-        if expression.type is ast.ConstantType.TRUE:
-            atom = atoms.BoolAtom(True, flags=flags)
-
-        elif expression.type is ast.ConstantType.FALSE:
-            atom = atoms.BoolAtom(False, flags=flags)
-
-        elif expression.type is ast.ConstantType.NONE:
-            atom = atoms.NONE
-
-        elif expression.type is ast.ConstantType.ELLIPSIS:
-            atom = atoms.ELLIPSIS
-
-        elif isinstance(expression, ast.StringNode):
-            atom = atoms.StringAtom(expression.value, flags=flags)
-
-        elif isinstance(expression, ast.IntegerNode):
-            atom = atoms.IntegerAtom(expression.value, flags=flags)
-
-        elif isinstance(expression, ast.FloatNode):
-            atom = atoms.FloatAtom(expression.value, flags=flags)
-
-        elif isinstance(expression, ast.ComplexNode):
-            atom = atoms.ComplexAtom(expression.value, flags=flags)
+        if type(expression) is ast.IntegerNode:
+            constants = INTEGER_CONSTANTS.get(expression.value)
+        else:
+            constants = KEYWORD_CONSTANTS.get(expression.type)
 
+        if constants is not None:
+            atom = constants[0] if evaluating_type else constants[1]
         else:
-            return atoms.ErrorAtom(atoms.ErrorCategory.SYNTAX_ERROR, 'invalid constant')
+            literal = LITERAL_CONSTANTS.get(type(expression))
+            if literal is None:
+                return atoms.ErrorAtom(atoms.ErrorCategory.SYNTAX_ERROR, 'invalid constant')
 
-        return atoms.get_type(atom) if self.is_evaluating_type() else atom
+            flags = atoms.AtomFlags.NONE if evaluating_type else atoms.AtomFlags.IMPLICIT
+            atom = literal(expression.value, flags=flags)
+
+        return atoms.get_type(atom) if evaluating_type else atom
 
     def visit_attribute_node(self, expression: ast.AttributeNode) -> atoms.Atom:
         value = self.visit_expression(expression.value)
@@ -490,14 +541,29 @@ class Atomizer(NodeVisitor[atoms.Atom]):
 
         return atoms.SliceAtom(start=start, stop=stop, step=step)
 
+    def visit_expression(self, expression: ast.ExpressionNode) -> atoms.Atom:
+        key = id(expression)
+
+        entry = self.expression_atoms.get(key)
+        if entry is not None:
+            return entry[1]
+
+        atom = super().visit_expression(expression)
+        self.expression_atoms[key] = (expression, atom)
+
+        return atom
+
     def visit_type_expression(self, expression: ast.ExpressionNode) -> atoms.Atom:
         context = self.ctx
-        self.ctx = AtomizerContext.TYPE
+        if context is AtomizerContext.TYPE:
+            return self.visit_expression(expression)
 
-        result = self.visit_expression(expression)
-        self.ctx = context
+        self.ctx = AtomizerContext.TYPE
 
-        return result
+        try:
+            return self.visit_expression(expression)
+        finally:
+            self.ctx = context
 
     def visit_inner_expression(self, expression: ast.ExpressionNode) -> atoms.Atom:
         atom = self.visit_expression(expression)
@@ -511,4 +577,5 @@ class Atomizer(NodeVisitor[atoms.Atom]):
     def visit_expression_list(
         self, expressions: typing.List[ast.ExpressionNode]
     ) -> typing.List[atoms.Atom]:
-        return [self.visit_inner_expression(expression) for expression in expressions]
+        visit_inner_expression = self.visit_inner_expression
+        return [visit_inner_expression(expression) for expression in expressions]
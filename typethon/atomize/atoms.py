@@ -69,18 +69,16 @@ class AtomBase(typing.Generic[KindT]):
         assert False, '<cannot instantiate non-type>'
 
     def uninstantiate(self) -> Atom:
-        assert isinstance(self, Atom)
-        return TypeAtom(self)
+        return TypeAtom(typing.cast(Atom, self))
 
     def remove_implicit_value(self) -> Atom:
-        if isinstance(self, LiteralAtom):
+        if self.kind in LITERAL_KINDS:
             if self.flags & AtomFlags.IMPLICIT:
-                atom = self.copy()
+                atom = typing.cast(LiteralAtom, self.copy())
                 atom.value = None
                 return atom
 
-        assert isinstance(self, Atom)
-        return self
+        return typing.cast(Atom, self)
 
     def unwrap_as(self, type: typing.Type[TypeT]) -> TypeT:
         assert isinstance(self, type)
@@ -131,6 +129,8 @@ class TypeAtom(AtomBase[typing.Literal[AtomKind.TYPE]]):
 class UnionAtom(AtomBase[typing.Literal[AtomKind.UNION]]):
     kind: typing.Literal[AtomKind.UNION] = attr.ib(init=False, default=AtomKind.UNION)
     values: typing.Optional[typing.List[Atom]] = attr.ib(default=None)
+    # Computed by is_unknown on first use
+    unknown: typing.Optional[bool] = attr.ib(init=False, default=None, eq=False, repr=False)
 
     def is_type(self) -> bool:
         return True
@@ -145,7 +145,7 @@ class UnionAtom(AtomBase[typing.Literal[AtomKind.UNION]]):
         if self.values is None:
             return self
 
-        return union(atom.remove_implicit_value() for atom in self.values)
+        return union([atom.remove_implicit_value() for atom in self.values])
 
 
 @attr.s(slots=True)
@@ -301,12 +301,60 @@ class FunctionParameter:
     default: typing.Optional[Atom] = attr.ib()
 
 
+@attr.s(kw_only=True, slots=True)
+class FunctionSignature:
+    parameters: typing.List[FunctionParameter] = attr.ib()
+    positional_parameters: typing.List[FunctionParameter] = attr.ib()
+    keyword_parameters: typing.Dict[str, FunctionParameter] = attr.ib()
+    varpositional_parameter: typing.Optional[FunctionParameter] = attr.ib()
+    varkeyword_parameter: typing.Optional[FunctionParameter] = attr.ib()
+
+
 @attr.s(kw_only=True, slots=True)
 class FunctionFields:
     name: str = attr.ib()
     parameters: typing.List[FunctionParameter] = attr.ib()
     returns: typing.Optional[Atom] = attr.ib()
     scope: typing.Optional[Scope] = attr.ib(default=None)
+    signature: typing.Optional[FunctionSignature] = attr.ib(
+        init=False, default=None, eq=False, repr=False
+    )
+
+    def get_signature(self) -> FunctionSignature:
+        if self.signature is not None:
+            return self.signature
+
+        parameters: typing.List[FunctionParameter] = []
+        positional_parameters: typing.List[FunctionParameter] = []
+        keyword_parameters: typing.Dict[str, FunctionParameter] = {}
+
+        varpositional_parameter = None
+        varkeyword_parameter = None
+
+        for parameter in self.parameters:
+            if parameter.kind is ParameterKind.VARARG:
+                varpositional_parameter = parameter
+
+            elif parameter.kind is ParameterKind.VARKWARG:
+                varkeyword_parameter = parameter
+
+            else:
+                parameters.append(parameter)
+
+                if parameter.kind in (ParameterKind.POSONLY, ParameterKind.ARG):
+                    positional_parameters.append(parameter)
+
+                if parameter.kind in (ParameterKind.ARG, ParameterKind.KWONLY):
+                    keyword_parameters[parameter.name] = parameter
+
+        self.signature = FunctionSignature(
+            parameters=parameters,
+            positional_parameters=positional_parameters,
+            keyword_parameters=keyword_parameters,
+            varpositional_parameter=varpositional_parameter,
+            varkeyword_parameter=varkeyword_parameter,
+        )
+        return self.signature
 
 
 @attr.s(slots=True)
@@ -361,10 +409,31 @@ class MethodAtom(AtomBase[typing.Literal[AtomKind.METHOD]]):
 
 
 def is_unknown(atom: Atom) -> TypeGuard[UnknownAtom]:
-    if atom.kind is AtomKind.UNION:
-        return atom.values is None or any(is_unknown(atom) for atom in atom.values)
+    if atom.kind is not AtomKind.UNION:
+        return atom.kind is AtomKind.UNKNOWN
+
+    if atom.unknown is None:
+        atom.unknown = contains_unknown(atom)
+
+    return atom.unknown
+
+
+def contains_unknown(atom: UnionAtom) -> bool:
+    unions = [atom]
 
-    return atom.kind is AtomKind.UNKNOWN
+    while unions:
+        atom = unions.pop()
+        if atom.values is None:
+            return True
+
+        for value in atom.values:
+            if value.kind is AtomKind.UNKNOWN:
+                return True
+
+            if value.kind is AtomKind.UNION:
+                unions.append(value)
+
+    return False
 
 
 def union(atoms: typing.Iterable[Atom]) -> Atom:
@@ -417,11 +486,23 @@ LiteralAtom = typing.Union[
     ComplexAtom,
 ]
 
+# Checking the kind avoids isinstance against the LiteralAtom union
+LITERAL_KINDS = frozenset(
+    (AtomKind.BOOL, AtomKind.STRING, AtomKind.INTEGER, AtomKind.FLOAT, AtomKind.COMPLEX)
+)
+
 TYPE = TypeAtom()
 UNION = UnionAtom()
 UNKNOWN = UnknownAtom()
 OBJECT = ObjectAtom()
 BOOL = BoolAtom()
+TRUE = BoolAtom(True)
+FALSE = BoolAtom(False)
+
+# Integers in this range are shared rather than allocated per result
+SMALL_INTEGERS: typing.Dict[int, IntegerAtom] = {
+    value: IntegerAtom(value) for value in range(-5, 257)
+}
 NONE = NoneAtom()
 ELLIPSIS = EllipsisAtom()
 STRING = StringAtom()
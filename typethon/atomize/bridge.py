@@ -36,6 +36,14 @@ ATOMS: typing.Dict[typing.Type[atoms.Atom], atoms.Atom] = {
     atoms.SliceAtom: atoms.get_type(atoms.SLICE),
 }
 
+PARAMETER_KINDS: typing.Dict[typing.Any, ast.ParameterKind] = {
+    inspect.Parameter.POSITIONAL_ONLY: ast.ParameterKind.POSONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD: ast.ParameterKind.ARG,
+    inspect.Parameter.VAR_POSITIONAL: ast.ParameterKind.VARARG,
+    inspect.Parameter.KEYWORD_ONLY: ast.ParameterKind.KWONLY,
+    inspect.Parameter.VAR_KEYWORD: ast.ParameterKind.VARKWARG,
+}
+
 
 def bridge_type(atom: typing.Union[typing.Optional[type], typing.Type[atoms.Atom]]) -> atoms.Atom:
     if isinstance(atom, type) and issubclass(atom, atoms.Atom):
@@ -84,17 +92,8 @@ def bridge_function(function: types.FunctionType, *, method: bool = True) -> ato
         if method and name == 'self':
             continue
 
-        if param.kind is param.POSITIONAL_ONLY:
-            kind = ast.ParameterKind.POSONLY
-        elif param.kind is param.POSITIONAL_OR_KEYWORD:
-            kind = ast.ParameterKind.ARG
-        elif param.kind is param.VAR_POSITIONAL:
-            kind = ast.ParameterKind.VARARG
-        elif param.kind is param.KEYWORD_ONLY:
-            kind = ast.ParameterKind.KWONLY
-        elif param.kind is param.VAR_KEYWORD:
-            kind = ast.ParameterKind.VARKWARG
-        else:
+        kind = PARAMETER_KINDS.get(param.kind)
+        if kind is None:
             raise TypeError(f'invalid parameter kind: {param.kind}')
 
         type = bridge_type(param.annotation)
@@ -121,15 +120,16 @@ def bridge_function(function: types.FunctionType, *, method: bool = True) -> ato
 
 def bridge_literal(value: LiteralT) -> atoms.Atom:
     if isinstance(value, bool):
-        return atoms.BoolAtom(value)
+        return atoms.TRUE if value else atoms.FALSE
     elif value is None:
-        return atoms.NoneAtom()
+        return atoms.NONE
     elif isinstance(value, types.EllipsisType):
-        return atoms.EllipsisAtom()
+        return atoms.ELLIPSIS
     elif isinstance(value, str):
         return atoms.StringAtom(value)
     elif isinstance(value, int):
-        return atoms.IntegerAtom(value)
+        atom = atoms.SMALL_INTEGERS.get(value)
+        return atom if atom is not None else atoms.IntegerAtom(value)
     elif isinstance(value, float):
         return atoms.FloatAtom(value)
     elif isinstance(value, complex):
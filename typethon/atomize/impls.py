@@ -13,6 +13,9 @@ else:
 
 ParamsT = typing.ParamSpec('ParamsT')
 
+# Bound once so that unwrap_as does not subscript typing.Union on every call
+NumberAtom = typing.Union[atoms.IntegerAtom, atoms.FloatAtom]
+
 
 def define(
     name: str, *, method: bool = True
@@ -55,6 +58,7 @@ class AtomImpl:
 
     def __init__(self, atomizer: Atomizer) -> None:
         self.atomizer = atomizer
+        self.attributes: typing.Dict[str, atoms.Atom] = {}
 
     def __init_subclass__(cls) -> None:
         cls.definitions = {}
@@ -69,27 +73,45 @@ class AtomImpl:
                 cls.definitions[fields.name] = function
 
     def get_attribute(self, name: str) -> atoms.Atom:
-        definition = self.definitions.get(name, atoms.UNKNOWN)
+        attribute = self.attributes.get(name)
+        if attribute is not None:
+            return attribute
+
+        attribute = self.definitions.get(name, atoms.UNKNOWN)
 
-        if isinstance(definition, atoms.BuiltinFunctionAtom):
-            return atoms.BuiltinFunctionAtom(
-                definition.fields,
-                function=types.MethodType(definition.function, self),
+        if isinstance(attribute, atoms.BuiltinFunctionAtom):
+            attribute = atoms.BuiltinFunctionAtom(
+                attribute.fields,
+                function=types.MethodType(attribute.function, self),
             )
 
-        return definition
+        self.attributes[name] = attribute
+        return attribute
 
 
 class TypeImpl(AtomImpl):
+    def __init__(self, atomizer: Atomizer) -> None:
+        super().__init__(atomizer)
+        # The operands are kept alongside the union so that their ids cannot be reused
+        self.unions: typing.Dict[
+            typing.Tuple[int, int], typing.Tuple[atoms.TypeAtom, atoms.TypeAtom, atoms.TypeAtom]
+        ] = {}
+
     @define('__or__')
     def bitor(
         self, left: atoms.TypeAtom, right: atoms.TypeAtom
     ) -> atoms.TypeAtom:
+        entry = self.unions.get((id(left), id(right)))
+        if entry is not None:
+            return entry[2]
+
         if left.value is None or right.value is None:
             raise RuntimeError('type atom is missing value')
 
-        union = atoms.union((left.instantiate(), right.instantiate()))
-        return atoms.TypeAtom(union)
+        union = atoms.TypeAtom(atoms.union((left.instantiate(), right.instantiate())))
+        self.unions[(id(left), id(right))] = (left, right, union)
+
+        return union
 
 
 class IntegerImpl(AtomImpl):
@@ -111,46 +133,40 @@ class IntegerImpl(AtomImpl):
     def add(
         self,
         left: atoms.IntegerAtom,
-        right: typing.Union[atoms.IntegerAtom, atoms.FloatAtom],
-    ) -> typing.Union[atoms.IntegerAtom, atoms.FloatAtom]:
+        right: NumberAtom,
+    ) -> NumberAtom:
         if left.value is None or right.value is None:
             return right
 
-        return bridge_literal(left.value + right.value).unwrap_as(
-            typing.Union[atoms.IntegerAtom, atoms.FloatAtom]
-        )
+        return bridge_literal(left.value + right.value).unwrap_as(NumberAtom)
 
     @define('__sub__')
     def sub(
         self,
         left: atoms.IntegerAtom,
-        right: typing.Union[atoms.IntegerAtom, atoms.FloatAtom],
-    ) -> typing.Union[atoms.IntegerAtom, atoms.FloatAtom]:
+        right: NumberAtom,
+    ) -> NumberAtom:
         if left.value is None or right.value is None:
             return right
 
-        return bridge_literal(left.value - right.value).unwrap_as(
-            typing.Union[atoms.IntegerAtom, atoms.FloatAtom]
-        )
+        return bridge_literal(left.value - right.value).unwrap_as(NumberAtom)
 
     @define('__mult__')
     def mult(
         self,
         left: atoms.IntegerAtom,
-        right: typing.Union[atoms.IntegerAtom, atoms.FloatAtom],
-    ) -> typing.Union[atoms.IntegerAtom, atoms.FloatAtom]:
+        right: NumberAtom,
+    ) -> NumberAtom:
         if left.value is None or right.value is None:
             return right
 
-        return bridge_literal(left.value * right.value).unwrap_as(
-            typing.Union[atoms.IntegerAtom, atoms.FloatAtom]
-        )
+        return bridge_literal(left.value * right.value).unwrap_as(NumberAtom)
 
     @define('__truediv__')
     def truediv(
         self,
         left: atoms.IntegerAtom,
-        right: typing.Union[atoms.IntegerAtom, atoms.FloatAtom],
+        right: NumberAtom,
     ) -> atoms.FloatAtom:
         if left.value is None or right.value is None:
             return atoms.FloatAtom()
@@ -161,40 +177,34 @@ class IntegerImpl(AtomImpl):
     def floordiv(
         self,
         left: atoms.IntegerAtom,
-        right: typing.Union[atoms.IntegerAtom, atoms.FloatAtom],
-    ) -> typing.Union[atoms.IntegerAtom, atoms.FloatAtom]:
+        right: NumberAtom,
+    ) -> NumberAtom:
         if left.value is None or right.value is None:
             return right
 
-        return bridge_literal(left.value // right.value).unwrap_as(
-            typing.Union[atoms.IntegerAtom, atoms.FloatAtom]
-        )
+        return bridge_literal(left.value // right.value).unwrap_as(NumberAtom)
 
     @define('__mod__')
     def mod(
         self,
         left: atoms.IntegerAtom,
-        right: typing.Union[atoms.IntegerAtom, atoms.FloatAtom],
-    ) -> typing.Union[atoms.IntegerAtom, atoms.FloatAtom]:
+        right: NumberAtom,
+    ) -> NumberAtom:
         if left.value is None or right.value is None:
             return right
 
-        return bridge_literal(left.value % right.value).unwrap_as(
-            typing.Union[atoms.IntegerAtom, atoms.FloatAtom]
-        )
+        return bridge_literal(left.value % right.value).unwrap_as(NumberAtom)
 
     @define('__pow__')
     def pow(
         self,
         left: atoms.IntegerAtom,
-        right: typing.Union[atoms.IntegerAtom, atoms.FloatAtom],
-    ) -> typing.Union[atoms.IntegerAtom, atoms.FloatAtom]:
+        right: NumberAtom,
+    ) -> NumberAtom:
         if left.value is None or right.value is None:
             return right
 
-        return bridge_literal(left.value**right.value).unwrap_as(
-            typing.Union[atoms.IntegerAtom, atoms.FloatAtom]
-        )
+        return bridge_literal(left.value**right.value).unwrap_as(NumberAtom)
 
     @define('__or__')
     def bitor(self, left: atoms.IntegerAtom, right: atoms.IntegerAtom) -> atoms.IntegerAtom:
@@ -284,29 +294,27 @@ class FunctionImpl(TypeImpl):
         final_keywords: typing.Dict[str, atoms.Atom] = {}
 
         fields = function.get_fields()
-        parameters = fields.parameters.copy()
+        signature = fields.get_signature()
 
-        varpositional_parameter = None
-        varkeyword_parameter = None
+        positional_parameters = signature.positional_parameters
+        keyword_parameters = signature.keyword_parameters.copy()
 
-        for parameter in fields.parameters:
-            if parameter.kind is atoms.ParameterKind.VARARG:
-                varpositional_parameter = parameter
-                parameters.remove(parameter)
+        varpositional_parameter = signature.varpositional_parameter
+        varkeyword_parameter = signature.varkeyword_parameter
 
-            elif parameter.kind is atoms.ParameterKind.VARKWARG:
-                varkeyword_parameter = parameter
-                parameters.remove(parameter)
+        # Names of the parameters that received an argument
+        bound: typing.Set[str] = set()
 
-        positional_parameters = [
-            parameter for parameter in parameters
-            if parameter.kind in (atoms.ParameterKind.POSONLY, atoms.ParameterKind.ARG)
-        ]
+        # Bound to locals since these are looked up once per argument
+        count = len(positional_parameters)
+        pop_keyword = keyword_parameters.pop
+        add_bound = bound.add
 
         for index, argument in enumerate(arguments):
-            if parameters:
-                parameter = positional_parameters.pop(0)
-                parameters.remove(parameter)
+            if index < count:
+                parameter = positional_parameters[index]
+                pop_keyword(parameter.name, None)
+                add_bound(parameter.name)
             else:
                 parameter = varpositional_parameter
 
@@ -319,15 +327,11 @@ class FunctionImpl(TypeImpl):
                 msg = f'argument {index} has no matching parameter'
                 errors.append(atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, msg))
 
-        keyword_parameters = {
-            parameter.name: parameter for parameter in parameters
-            if parameter.kind in (atoms.ParameterKind.ARG, atoms.ParameterKind.KWONLY)
-        }
-
         for name, argument in keywords.items():
-            if name in keyword_parameters:
-                parameter = keyword_parameters.pop(name)
-                parameters.remove(parameter)
+            parameter = pop_keyword(name, None)
+
+            if parameter is not None:
+                add_bound(name)
             else:
                 parameter = varkeyword_parameter
 
@@ -340,13 +344,18 @@ class FunctionImpl(TypeImpl):
                 msg = f'argument {name!r} has no matching parameter'
                 errors.append(atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, msg))
 
-        iterator = (parameter for parameter in parameters if parameter.default is not None)
-        for parameter in iterator:
-            msg = f'missing argument for parameter {parameter.name!r}'
-            errors.append(atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, msg))
+        for parameter in signature.parameters:
+            if parameter.name not in bound and parameter.default is None:
+                msg = f'missing argument for parameter {parameter.name!r}'
+                errors.append(atoms.ErrorAtom(atoms.ErrorCategory.TYPE_ERROR, msg))
+
+        invalid = bool(errors)
 
-        iterator = itertools.chain(final_arguments, final_keywords.values())
-        invalid = errors or any(atoms.is_unknown(atom) for atom in iterator)
+        if not invalid:
+            for atom in itertools.chain(final_arguments, final_keywords.values()):
+                if atoms.is_unknown(atom):
+                    invalid = True
+                    break
 
         if not invalid and isinstance(function, atoms.BuiltinFunctionAtom):
             result = function.function(*final_arguments, **final_keywords)
@@ -355,6 +364,10 @@ class FunctionImpl(TypeImpl):
         else:
             result = atoms.UNKNOWN
 
+        # union() returns any other atom unchanged; only unions are normalized by it
+        if not errors and result.kind is not atoms.AtomKind.UNION:
+            return result
+
         return atoms.union((result, *errors))
 
 
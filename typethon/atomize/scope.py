@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import enum
+import sys
 import typing
 
 import attr
@@ -24,6 +25,8 @@ class ScopeType(enum.Enum):
 
 
 class Scope:
+    __slots__ = ('symbols', 'type', 'parent')
+
     def __init__(
         self,
         type: ScopeType,
@@ -61,18 +64,18 @@ class Scope:
     def is_function_scope(self) -> bool:
         return self.type is ScopeType.FUNCTION
 
-    def get_parent(self) -> Self:
-        if self.parent is None:
-            raise ValueError('scope does not have parent')
-
-        return self.parent
-
     def add_symbol(self, name: str, atom: atoms.Atom) -> None:
+        name = sys.intern(name)
         self.symbols[name] = Symbol(name, atom)
 
     def get_symbol(self, name: str) -> typing.Optional[Symbol]:
-        symbol = self.symbols.get(name)
-        if symbol is not None or self.parent is None:
-            return symbol
+        scope: typing.Optional[Scope] = self
+
+        while scope is not None:
+            symbol = scope.symbols.get(name)
+            if symbol is not None:
+                return symbol
+
+            scope = scope.parent
 
-        return self.parent.get_symbol(name)
+        return None
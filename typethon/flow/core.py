@@ -13,24 +13,38 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         self.atomizer = atomizer.Atomizer()
 
     def requires_flow(self, atom: atoms.Atom) -> bool:
-        if isinstance(atom, atoms.LiteralAtom):
-            return atom.value is None and atom.kind is not atoms.AtomKind.NONE
+        stack = [atom]
+        pop = stack.pop
+        literal_kinds = atoms.LITERAL_KINDS
 
-        elif atom.kind is atoms.AtomKind.OBJECT:
-            return atom.value is None or self.requires_flow(atom.value)
+        while stack:
+            atom = pop()
 
-        elif atom.kind is atoms.AtomKind.TUPLE:
-            if atom.values is not None:
-                return any(self.requires_flow(value) for value in atom.values)
+            if atom.kind in literal_kinds:
+                if atom.value is None and atom.kind is not atoms.AtomKind.NONE:
+                    return True
 
-        return atom.kind is atoms.AtomKind.UNKNOWN or not atom.is_type()
+            elif atom.kind is atoms.AtomKind.OBJECT:
+                if atom.value is None:
+                    return True
+
+                stack.append(atom.value)
+
+            elif atom.kind is atoms.AtomKind.TUPLE and atom.values is not None:
+                stack.extend(atom.values)
+
+            elif atom.kind is atoms.AtomKind.UNKNOWN or not atom.is_type():
+                return True
+
+        return False
 
     def bind_atom(self, node: ast.Node, atom: atoms.Atom) -> nodes.AtomFlow:
         return nodes.AtomFlow(startpos=node.startpos, endpos=node.endpos, atom=atom)
 
     def visit_functiondef_node(self, statement: ast.FunctionDefNode) -> nodes.AtomFlow:
         atom = self.atomizer.visit_functiondef_node(statement)
-        assert isinstance(atom, atoms.FunctionAtom)
+        if atom.kind is not atoms.AtomKind.FUNCTION:
+            return self.bind_atom(statement, atom)
 
         decorators: typing.List[nodes.AtomFlow] = []
         for decorator in reversed(statement.decorators):
@@ -102,7 +116,7 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_boolop_node(self, expression: ast.BoolOpNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_boolop_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -117,24 +131,41 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_binaryop_node(self, expression: ast.BinaryOpNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_binaryop_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
-        left = self.visit_expression(expression.left)
-        right = self.visit_expression(expression.right)
+        # Walk the left spine iteratively like the atomizer does; the operand atoms
+        # are already memoized by the visit above.
+        chain = [(expression, atom)]
 
-        return nodes.BinaryOpFlow(
-            startpos=expression.startpos,
-            endpos=expression.endpos,
-            atom=atom,
-            left=left,
-            op=expression.op,
-            right=right,
-        )
+        operand = expression.left
+        while type(operand) is ast.BinaryOpNode:
+            operand_atom = self.atomizer.visit_expression(operand)
+            if not self.requires_flow(operand_atom):
+                break
+
+            chain.append((operand, operand_atom))
+            operand = operand.left
+
+        left = self.visit_expression(operand)
+
+        for node, node_atom in reversed(chain):
+            right = self.visit_expression(node.right)
+
+            left = nodes.BinaryOpFlow(
+                startpos=node.startpos,
+                endpos=node.endpos,
+                atom=node_atom,
+                left=left,
+                op=node.op,
+                right=right,
+            )
+
+        return left
 
     def visit_unaryop_node(self, expression: ast.UnaryOpNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_unaryop_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -149,7 +180,7 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_ifexp_node(self, expression: ast.IfExpNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_ifexp_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -167,7 +198,7 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_dict_node(self, expression: ast.DictNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_dict_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -187,7 +218,7 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_set_node(self, expression: ast.SetNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_set_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -201,7 +232,7 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_call_node(self, expression: ast.CallNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_call_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -224,11 +255,11 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_constant_node(self, expression: ast.ConstantNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_constant_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         return self.bind_atom(expression, atom)
 
     def visit_attribute_node(self, expression: ast.AttributeNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_attribute_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -243,7 +274,7 @@ class FlowCore(NodeVisitor[nodes.AtomFlow]):
         )
 
     def visit_name_node(self, expression: ast.NameNode) -> nodes.AtomFlow:
-        atom = self.atomizer.visit_name_node(expression)
+        atom = self.atomizer.visit_expression(expression)
         if not self.requires_flow(atom):
             return self.bind_atom(expression, atom)
 
@@ -1,3 +1,4 @@
+import sys
 import typing
 
 from ..tokens import (
@@ -187,7 +188,7 @@ class Scanner:
         assert is_identifier_start(char)
 
         self.consume_while(is_identifier)
-        content = self.source[start:self.position]
+        content = sys.intern(self.source[start:self.position])
 
         if self.peek_char() in '\'\"':
             flags = StringTokenFlags.NONE
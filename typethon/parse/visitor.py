@@ -10,12 +10,20 @@ __all__ = ('NodeVisitor',)
 VisitT = typing.TypeVar('VisitT')
 
 
+def get_subclasses(cls: type) -> typing.List[type]:
+    subclasses = cls.__subclasses__()
+    for subclass in subclasses:
+        subclasses.extend(subclass.__subclasses__())
+
+    return subclasses
+
+
 class NodeVisitor(typing.Generic[VisitT]):
     expression_visitors: typing.Dict[
-        str, typing.Callable[[NodeVisitor[VisitT], ast.ExpressionNode], VisitT]
+        type, typing.Callable[[NodeVisitor[VisitT], ast.ExpressionNode], VisitT]
     ]
     statement_visitors: typing.Dict[
-        str, typing.Callable[[NodeVisitor[VisitT], ast.StatementNode], VisitT]
+        type, typing.Callable[[NodeVisitor[VisitT], ast.StatementNode], VisitT]
     ]
 
     def __init_subclass__(cls) -> None:
@@ -30,11 +38,24 @@ class NodeVisitor(typing.Generic[VisitT]):
 
             expression: typing.Optional[str] = annotations.get('expression')
             if expression is not None:
-                cls.expression_visitors[expression.split('.')[-1]] = function
+                cls.register_visitor(cls.expression_visitors, expression, function)
 
             statement: typing.Optional[str] = annotations.get('statement')
             if statement is not None:
-                cls.statement_visitors[statement.split('.')[-1]] = function
+                cls.register_visitor(cls.statement_visitors, statement, function)
+
+    @staticmethod
+    def register_visitor(
+        visitors: typing.Dict[type, typing.Any], annotation: str, function: typing.Any
+    ) -> None:
+        node = getattr(ast, annotation.split('.')[-1], None)
+
+        if isinstance(node, type):
+            visitors[node] = function
+
+            # Subclasses use their base's visitor unless they define their own
+            for subclass in get_subclasses(node):
+                visitors.setdefault(subclass, function)
 
     def visit_functiondef_node(self, statement: ast.FunctionDefNode) -> VisitT:
         raise NotImplementedError
@@ -175,18 +196,14 @@ class NodeVisitor(typing.Generic[VisitT]):
         raise NotImplementedError
 
     def visit_expression(self, expression: ast.ExpressionNode) -> VisitT:
-        if isinstance(expression, ast.ConstantNode):
-            return self.visit_constant_node(expression)
-        else:
-            visitor = self.expression_visitors.get(expression.__class__.__name__)
-
-            if visitor is not None:
-                return visitor(self, expression)
+        visitor = self.expression_visitors.get(expression.__class__)
+        if visitor is not None:
+            return visitor(self, expression)
 
         raise TypeError(f'No visitor implemented for {expression.__class__.__name__!r}')
 
     def visit_statement(self, statement: ast.StatementNode) -> VisitT:
-        visitor = self.statement_visitors.get(statement.__class__.__name__)
+        visitor = self.statement_visitors.get(statement.__class__)
         if visitor is not None:
             return visitor(self, statement)
 